@@ -1,28 +1,102 @@
 """Parametric luggage tag generator using CadQuery."""
 
-from dataclasses import dataclass, asdict
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
+import functools
+import importlib.metadata
+import importlib.util
+import io
 import os
+import shutil
+import sys
 os.environ["PYGLET_HEADLESS"] = "True"
 import argparse
-import yaml
-import cadquery as cq
-import trimesh
 import hashlib
 import json
 import random
 from typing import Optional, Iterable, Tuple, List
 
+
+def _lazy_import(name: str):
+    """Return ``name`` as a module whose body only executes on first attribute access.
+
+    CadQuery/OCCT and trimesh take about a second to import; deferring them
+    keeps ``--help``, argument errors and light helpers (hashing, YAML)
+    from paying that cost.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def _resolve_lazy(*modules) -> None:
+    """Run any still-deferred imports now, before a worker thread needs them.
+
+    ``LazyLoader`` is not thread-safe before Python 3.12: two threads touching
+    a module first can both execute its body.
+    """
+    for module in modules:
+        if module is not None:
+            getattr(module, "__name__")
+
+
+yaml = _lazy_import("yaml")
+cq = _lazy_import("cadquery")
+np = _lazy_import("numpy")
+trimesh = _lazy_import("trimesh")
+
+
 # Optional PNG preview support
+@functools.cache
+def _cairosvg():
+    try:
+        import cairosvg  # type: ignore
+    except Exception:  # pragma: no cover - missing system cairo
+        return None
+    return cairosvg
+
+
+def __getattr__(name: str):
+    # keep ``generate_tag.cairosvg`` available without importing it eagerly
+    if name == "cairosvg":
+        return _cairosvg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Direct PNG rasterization of previews
+if importlib.util.find_spec("PIL") is not None:
+    Image = _lazy_import("PIL.Image")
+    ImageDraw = _lazy_import("PIL.ImageDraw")
+else:  # pragma: no cover
+    Image = ImageDraw = None
+
+# Fast non-cryptographic hash for mesh identity (falls back to SHA-256)
 try:
-    import cairosvg  # type: ignore
-except Exception:  # pragma: no cover - missing system cairo
-    cairosvg = None
+    import xxhash  # type: ignore
+except Exception:  # pragma: no cover
+    xxhash = None
 
-# QR encoder (pure-Python)
+# Mesh booleans for --engine manifold
 try:
-    import segno  # type: ignore
-except Exception as e:  # pragma: no cover
+    import manifold3d  # type: ignore
+except Exception:  # pragma: no cover
+    manifold3d = None
+
+# QR encoder (pure-Python); deferred, a warm matrix cache never needs it
+if importlib.util.find_spec("segno") is not None:
+    segno = _lazy_import("segno")
+else:  # pragma: no cover
     segno = None
 
 
@@ -63,10 +137,22 @@ class Params:
     back_text_depth: float = 0.3
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict:
+    # LibYAML-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path).read_text(), Loader=loader) or {}
+
+
+def _load_yaml(path: Path) -> dict:
+    """Parse a YAML file, cached until its mtime changes. Treat as read-only."""
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
+
+
 def load_params(path: Path | None) -> Params:
     params = Params()
     if path and path.exists():
-        data = yaml.safe_load(path.read_text())
+        data = _load_yaml(path)
         for k, v in data.items():
             setattr(params, k, v)
     return params
@@ -81,7 +167,7 @@ def apply_preset(params: Params, yaml_path: Optional[Path], preset: Optional[str
         return params, rec_layer
     data = {}
     if yaml_path and yaml_path.exists():
-        data = yaml.safe_load(yaml_path.read_text()) or {}
+        data = _load_yaml(yaml_path)
     presets = (data or {}).get('presets', {})
     prof = presets.get(preset)
     if not prof:
@@ -93,55 +179,163 @@ def apply_preset(params: Params, yaml_path: Optional[Path], preset: Optional[str
     return params, rec_layer
 
 
-def build_body(p: Params) -> tuple[cq.Workplane, float, float]:
-    """Build the tag body with pockets and strap feature."""
+def params_hash(p: Params, **extra) -> str:
+    """Canonical digest of ``p`` plus any other build inputs in ``extra``.
+
+    The generator source is folded in so cached outputs are invalidated when
+    the geometry code changes.
+    """
+    payload = yaml.safe_dump({"params": asdict(p), "generator": _generator_digest(), **extra}, sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _generator_digest() -> str:
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _toolchain() -> str:
+    """CadQuery version and a fingerprint of the OCP (OCCT) binary.
+
+    Read from package metadata and the extension's stat, so a cache lookup
+    never pays for importing either.
+    """
+    ocp = importlib.util.find_spec("OCP")
+    st = os.stat(ocp.origin) if ocp is not None and ocp.origin else None
+    return f"cadquery {importlib.metadata.version('cadquery')}; OCP {st and (st.st_size, st.st_mtime_ns)}"
+
+
+# Fields the body/island builders read; text-only edits leave their caches warm
+GEOMETRY_FIELDS = (
+    "qr_w", "qr_h", "qr_border", "body_t", "min_wall", "corner_r", "nfc_d", "nfc_depth",
+    "fit_clearance", "strap_hole_d", "strap_slot_w", "strap_slot_l", "qr_pocket_depth", "island_h",
+)
+
+
+def _params_key(p: Params) -> tuple:
+    """Hashable snapshot of the geometric fields of ``p`` used to memoize builders."""
+    return tuple((name, getattr(p, name)) for name in GEOMETRY_FIELDS)
+
+
+def _brep_cache_dir() -> Optional[Path]:
+    """Directory for persisted builder results; ``LUGGAGE_TAG_CACHE=""`` disables it."""
+    env = os.environ.get("LUGGAGE_TAG_CACHE")
+    if env is not None:
+        return Path(env).expanduser() if env else None
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "luggage_tag"
+
+
+def _brep_cached(kind: str, key: tuple, build) -> cq.Workplane:
+    """Return ``build()``, persisted on disk as binary BRep keyed by ``key``.
+
+    Entries are content addressed on the key, the generator source and the
+    CadQuery version, so stale shapes are never reused; unreadable entries
+    are rebuilt. The binary format round-trips coordinates exactly, so warm
+    and cold builds tessellate (and hash) identically.
+    """
+    root = _brep_cache_dir()
+    if root is None:
+        return build()
+    ident = repr((kind, key, _generator_digest(), cq.__version__))
+    path = root / f"{hashlib.blake2b(ident.encode('utf-8'), digest_size=16).hexdigest()}.bin"
+    if path.exists():
+        try:
+            with path.open("rb") as f:
+                return cq.Workplane("XY").newObject([cq.Shape.importBin(f)])
+        except Exception:
+            pass
+    wp = build()
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            _write_bin(_to_shape(wp), f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only or full cache dir: the in-memory result is still good
+    return wp
+
+
+@dataclass(frozen=True, slots=True)
+class Derived:
+    """Geometry derived from :class:`Params`, computed once and shared."""
+    width: float
+    height: float
+    half_t: float
+    pocket_w: float
+    pocket_h: float
+    strap_center_y: float
+    pad_d: float
+    pad_len: float
+    pad_w: float
+
+
+def derive(p: Params) -> Derived:
     width = p.qr_w + 2 * p.qr_border
     height = p.qr_h + 2 * p.qr_border
+    return Derived(
+        width=width,
+        height=height,
+        half_t=p.body_t / 2,
+        pocket_w=p.qr_w + p.fit_clearance,
+        pocket_h=p.qr_h + p.fit_clearance,
+        strap_center_y=height / 2 - p.min_wall - ((p.strap_slot_l or p.strap_hole_d) / 2),
+        pad_d=p.strap_hole_d + 2 * p.min_wall,
+        pad_len=p.strap_slot_l + 2 * p.min_wall,
+        pad_w=p.strap_slot_w + 2 * p.min_wall,
+    )
+
+
+def build_body(p: Params) -> tuple[cq.Workplane, float, float]:
+    """Build the tag body with pockets and strap feature.
+
+    Results are memoized per parameter set so batch drivers calling
+    ``build_and_export`` repeatedly skip the OCCT rebuild.
+    """
+    return _build_body_cached(_params_key(p))
+
+
+@functools.lru_cache(maxsize=16)
+def _build_body_cached(key: tuple) -> tuple[cq.Workplane, float, float]:
+    p = Params(**dict(key))
+    d = derive(p)
 
     if p.nfc_depth + p.qr_pocket_depth > p.body_t - 0.6:
         raise ValueError("Invalid pockets: nfc_depth + qr_pocket_depth must be <= body_t - 0.6")
+    return _brep_cached("body", key, lambda: _make_body(p, d)), d.width, d.height
+
 
+def _make_body(p: Params, d: Derived) -> cq.Workplane:
+    # Outline with filleted corners plus the strap reinforcement pad, fused in
+    # 2D so only one prism is extruded (no 3D boolean for the pad).
+    outline = cq.Sketch().rect(d.width, d.height).vertices().fillet(p.corner_r).reset()
+    slot = bool(p.strap_slot_w and p.strap_slot_l)
+    if slot:
+        outline = outline.push([(0, d.strap_center_y)]).slot(d.pad_len - d.pad_w, d.pad_w)
+    else:
+        outline = outline.push([(0, d.strap_center_y)]).circle(d.pad_d / 2)
     body = (
         cq.Workplane("XY")
-        .rect(width, height)
-        .extrude(p.body_t / 2, both=True)
+        .workplane(offset=-d.half_t)
+        .placeSketch(outline.clean())
+        .extrude(p.body_t)
     )
-    body = body.edges("|Z").fillet(p.corner_r)
 
-    # Strap reinforcement and hole/slot
-    strap_center_y = height / 2 - p.min_wall - (
-        (p.strap_slot_l or p.strap_hole_d) / 2
-    )
-    if p.strap_slot_w and p.strap_slot_l:
-        pad_len = p.strap_slot_l + 2 * p.min_wall
-        pad_w = p.strap_slot_w + 2 * p.min_wall
-        pad = (
-            cq.Workplane("XY")
-            .center(0, strap_center_y)
-            .slot2D(pad_len, pad_w)
-            .extrude(p.body_t / 2, both=True)
-        )
-        body = body.union(pad)
+    # Strap hole/slot
+    if slot:
         body = (
             body.faces(">Z")
             .workplane()
-            .center(0, strap_center_y)
+            .center(0, d.strap_center_y)
             .slot2D(p.strap_slot_l, p.strap_slot_w)
             .cutThruAll()
         )
     else:
-        pad_d = p.strap_hole_d + 2 * p.min_wall
-        pad = (
-            cq.Workplane("XY")
-            .center(0, strap_center_y)
-            .circle(pad_d / 2)
-            .extrude(p.body_t / 2, both=True)
-        )
-        body = body.union(pad)
         body = (
             body.faces(">Z")
             .workplane()
-            .center(0, strap_center_y)
+            .center(0, d.strap_center_y)
             .circle(p.strap_hole_d / 2)
             .cutThruAll()
         )
@@ -149,12 +343,10 @@ def build_body(p: Params) -> tuple[cq.Workplane, float, float]:
     body = body.edges(">Z").fillet(0.5)
 
     # Front QR pocket
-    pocket_w = p.qr_w + p.fit_clearance
-    pocket_h = p.qr_h + p.fit_clearance
     body = (
         body.faces(">Z")
         .workplane()
-        .rect(pocket_w, pocket_h)
+        .rect(d.pocket_w, d.pocket_h)
         .cutBlind(-p.qr_pocket_depth)
     )
 
@@ -165,28 +357,39 @@ def build_body(p: Params) -> tuple[cq.Workplane, float, float]:
         .circle((p.nfc_d + p.fit_clearance) / 2)
         .cutBlind(-p.nfc_depth)
     )
+    return body
 
-    return body, width, height
+
+def _rect_wire(w: float, h: float, z: float = 0.0) -> cq.Wire:
+    """Closed axis-aligned rectangle centred on the origin at height ``z``."""
+    return cq.Wire.makePolygon(
+        [(-w / 2, -h / 2, z), (w / 2, -h / 2, z), (w / 2, h / 2, z), (-w / 2, h / 2, z)],
+        close=True,
+    )
 
 
 def build_islands(p: Params) -> cq.Workplane:
-    outer_w = p.qr_w + 2 * p.qr_border
-    outer_h = p.qr_h + 2 * p.qr_border
-    pocket_w = p.qr_w + p.fit_clearance
-    pocket_h = p.qr_h + p.fit_clearance
-    ring = (
-        cq.Workplane("XY")
-        .rect(outer_w, outer_h)
-        .rect(pocket_w, pocket_h)
-        .extrude(p.island_h)
-        .translate((0, 0, p.body_t / 2))
-    )
-    strap_center_y = outer_h / 2 - p.min_wall - ((p.strap_slot_l or p.strap_hole_d) / 2)
+    """Build the raised QR border ring (memoized per parameter set)."""
+    return _build_islands_cached(_params_key(p))
+
+
+@functools.lru_cache(maxsize=16)
+def _build_islands_cached(key: tuple) -> cq.Workplane:
+    p = Params(**dict(key))
+    return _brep_cached("islands", key, lambda: _make_islands(p, derive(p)))
+
+
+def _make_islands(p: Params, d: Derived) -> cq.Workplane:
+    # Build the ring face directly from an outer wire and one hole wire
+    outer = _rect_wire(d.width, d.height, d.half_t)
+    hole = _rect_wire(d.pocket_w, d.pocket_h, d.half_t)
+    face = cq.Face.makeFromWires(outer, [hole])
+    ring = cq.Workplane("XY").newObject([cq.Solid.extrudeLinear(face, cq.Vector(0, 0, p.island_h))])
     if p.strap_slot_w and p.strap_slot_l:
         ring = (
             ring.faces(">Z")
             .workplane()
-            .center(0, strap_center_y)
+            .center(0, d.strap_center_y)
             .slot2D(p.strap_slot_l, p.strap_slot_w)
             .cutThruAll()
         )
@@ -194,7 +397,7 @@ def build_islands(p: Params) -> cq.Workplane:
         ring = (
             ring.faces(">Z")
             .workplane()
-            .center(0, strap_center_y)
+            .center(0, d.strap_center_y)
             .circle(p.strap_hole_d / 2)
             .cutThruAll()
         )
@@ -202,35 +405,77 @@ def build_islands(p: Params) -> cq.Workplane:
     return ring
 
 
-def _text_solid_front(p: Params, width: float, height: float) -> cq.Workplane:
-    if not p.front_prompt_text:
+def fast_union(a: cq.Workplane, b: cq.Workplane, tol: float = 0.0) -> cq.Workplane:
+    """Union two workplanes, skipping the OCCT boolean when they can't meet.
+
+    If the bounding boxes are strictly separated (by more than ``tol``) on any
+    axis the solids are disjoint, so a plain compound is equivalent for export
+    and far cheaper than a BOP fuse. Touching solids still get the boolean:
+    OCCT pads each box by the shape tolerance, so a shared face never passes.
+    """
+    ba, bb = _to_shape(a).BoundingBox(), _to_shape(b).BoundingBox()
+    separated = (
+        ba.xmax < bb.xmin - tol or bb.xmax < ba.xmin - tol
+        or ba.ymax < bb.ymin - tol or bb.ymax < ba.ymin - tol
+        or ba.zmax < bb.zmin - tol or bb.zmax < ba.zmin - tol
+    )
+    if not separated:
+        return a.union(b)
+    return cq.Workplane(obj=cq.Compound.makeCompound([*a.vals(), *b.vals()]))
+
+
+def tree_union(parts: List[cq.Workplane]) -> cq.Workplane:
+    """Union ``parts`` pairwise in a balanced tree instead of into one accumulator.
+
+    Each boolean then sees operands of similar size, and pairs that can't
+    overlap are combined without one (see :func:`fast_union`).
+    """
+    if not parts:
         return cq.Workplane("XY")
+    while len(parts) > 1:
+        parts = [fast_union(parts[i], parts[i + 1]) if i + 1 < len(parts) else parts[i] for i in range(0, len(parts), 2)]
+    return parts[0]
+
+
+def build_all(p: Params) -> cq.Workplane:
+    """Body and ring island fused into one solid (they share the top face).
+
+    Memoized, so the STL export and both previews share one boolean; the
+    individual solids stay available through ``build_body``/``build_islands``.
+    """
+    return _build_all_cached(_params_key(p))
+
+
+@functools.lru_cache(maxsize=16)
+def _build_all_cached(key: tuple) -> cq.Workplane:
+    p = Params(**dict(key))
+    return fast_union(build_body(p)[0], build_islands(p))
+
+
+def _text_solid_front(p: Params, width: float, height: float) -> Optional[cq.Workplane]:
+    """Front prompt solid, or None when there is no prompt to place."""
+    if not (p.front_prompt_text or "").strip():
+        return None
     edge = p.front_prompt_edge.lower()
     margin = p.front_prompt_margin
     # Position line near chosen edge
     x = 0.0
     y = 0.0
-    rot = 0
     if edge == "top":
         y = height / 2 - margin
     elif edge == "bottom":
         y = -height / 2 + margin
     elif edge == "left":
         x = -width / 2 + margin
-        rot = 90
     else:  # right
         x = width / 2 - margin
-        rot = 90
-    wp = cq.Workplane("XY").workplane(offset=p.body_t / 2)
-    txt = wp.center(x, y).rotate((0, 0, 0), (0, 0, 1), rot).text(
+    glyphs = _text_shape(
         p.front_prompt_text,
         p.front_prompt_h,
         p.front_text_height if p.front_text_style == "emboss" else p.front_text_depth,
-        kind="bold",
-        cut=False,
-        combine=True,
-        font=p.front_font_path or "Sans",
+        p.front_font_path or "Sans",
     )
+    txt = cq.Workplane("XY").newObject([glyphs.translate(cq.Vector(x, y, p.body_t / 2))])
     if p.front_text_style == "emboss":
         return txt
     else:
@@ -238,21 +483,84 @@ def _text_solid_front(p: Params, width: float, height: float) -> cq.Workplane:
         return txt
 
 
-def _text_solids_back(p: Params, width: float, height: float) -> cq.Workplane:
-    lines = [s for s in [p.back_name, p.back_phone, p.back_address] if s]
+def _text_solids_back(p: Params, width: float, height: float) -> Optional[cq.Workplane]:
+    """Back contact lines as one solid, or None when every line is blank."""
+    lines = [s for s in [p.back_name, p.back_phone, p.back_address] if s and s.strip()]
     if not lines:
-        return cq.Workplane("XY")
+        return None
     # Compute layout area (back face): respect margins and NFC/strap keep-outs crudely by using inner rectangle
     inner_w = width - 2 * p.back_margin
     inner_h = height - 2 * p.back_margin
-    wp = cq.Workplane("XY").workplane(offset=-p.body_t / 2)
     y0 = inner_h / 2 - p.back_text_h  # start near top of inner rect
-    solid = cq.Workplane("XY")
+    depth = p.back_text_height if p.back_text_style == "emboss" else p.back_text_depth
+    parts = []
     for i, text in enumerate(lines):
         y = y0 - i * (p.back_text_h + p.back_line_gap)
-        t = wp.center(0, y).text(text, p.back_text_h, p.back_text_height if p.back_text_style == "emboss" else p.back_text_depth, kind="bold", cut=False, combine=True, font=p.back_font_path or "Sans")
-        solid = solid.union(t)
-    return solid
+        glyphs = _text_shape(text, p.back_text_h, depth, p.back_font_path or "Sans")
+        parts.append(cq.Workplane("XY").newObject([glyphs.translate(cq.Vector(0, y, -p.body_t / 2))]))
+    return tree_union(parts)
+
+
+@functools.lru_cache(maxsize=64)
+def _text_shape(text: str, size: float, depth: float, font: str) -> cq.Shape:
+    """Bold extruded ``text`` centred on the XY origin.
+
+    Each ``Workplane.text`` call loads the font through OCCT's font manager
+    and rebuilds every glyph; callers translate this cached copy instead
+    (``Shape.translate`` returns a new shape, the cache entry is untouched).
+    """
+    return cq.Compound.makeText(text, size, depth, font=font, kind="bold").clean()
+
+
+@functools.lru_cache(maxsize=16)
+def _qr_matrix(payload: str | bytes, border: int) -> np.ndarray:
+    """Encode ``payload`` once and return its modules (plus ``border``) as a bool array.
+
+    Text is encoded at error level M; raw bytes (an external SVG) best-effort
+    without micro codes. Cached, so the islands and the sticker share one
+    encode per run, and persisted next to the BRep cache so later runs with
+    the same payload skip segno entirely; the array is read-only.
+    """
+    root = _brep_cache_dir()
+    path = None
+    if root is not None:
+        raw = payload.encode("utf-8") if isinstance(payload, str) else b"\x00" + payload
+        ident = hashlib.blake2b(raw, digest_size=16)
+        ident.update(repr((border, _generator_digest())).encode("utf-8"))
+        path = root / f"qr-{ident.hexdigest()}.npy"
+        try:
+            matrix = np.load(path, allow_pickle=False)
+            matrix.flags.writeable = False
+            return matrix
+        except (OSError, ValueError):
+            pass
+    if isinstance(payload, str):
+        qr = segno.make(payload, error='m')
+    else:
+        qr = segno.make(payload, micro=False)  # might fail; best-effort
+    # qr.matrix is rows of 0/1 bytes; convert in C and add the quiet zone
+    matrix = np.pad(np.array(qr.matrix, dtype=np.bool_), border)
+    if path is not None:
+        try:
+            root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with tmp.open("wb") as f:
+                np.save(f, matrix, allow_pickle=False)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _qr_runs(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Horizontal runs of dark modules as (row, start column, length) arrays."""
+    padded = np.zeros((matrix.shape[0], matrix.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = matrix
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows, starts, ends - starts
 
 
 def build_qr_islands(p: Params, qr_text: Optional[str], qr_svg: Optional[Path]) -> Tuple[cq.Workplane, dict]:
@@ -261,38 +569,63 @@ def build_qr_islands(p: Params, qr_text: Optional[str], qr_svg: Optional[Path])
         return build_islands(p), {"mode": "ring"}
     if segno is None:
         raise RuntimeError("QR features requested but segno is not available. Add segno to requirements.")
-    if qr_text:
-        qr = segno.make(qr_text, error='m')
-        payload_hash = hashlib.sha256(qr_text.encode('utf-8')).hexdigest()
-    else:
-        # Load external SVG as QR, segno can open only text; we approximate by embedding
-        svg_data = Path(qr_svg).read_bytes()
-        qr = segno.make(svg_data, micro=False)  # might fail; best-effort
-        payload_hash = hashlib.sha256(svg_data).hexdigest()
-    # Matrix including quiet zone when asked; we'll explicitly add quiet zone modules = 4
-    msize = qr.symbol_size(quiet_zone=4)
-    modules = msize[0]  # width in modules including quiet zone
+    # Load external SVG as QR, segno can open only text; we approximate by embedding
+    payload = qr_text if qr_text else Path(qr_svg).read_bytes()
+    wp, meta = _build_qr_islands_cached(_params_key(p), payload)
+    return wp, dict(meta)
+
+
+# Side of the bridge joining diagonally adjacent QR modules (mm); well below
+# nozzle width, so it only makes the island layer manifold
+QR_BRIDGE = 0.05
+
+
+@functools.lru_cache(maxsize=16)
+def _build_qr_islands_cached(key: tuple, payload: str | bytes) -> Tuple[cq.Workplane, dict]:
+    p = Params(**dict(key))
+    raw = payload.encode('utf-8') if isinstance(payload, str) else payload
+    payload_hash = hashlib.sha256(raw).hexdigest()
+    # Module matrix including an explicit quiet zone of 4 modules
     qz = 4
-    pocket_w = p.qr_w + p.fit_clearance
-    pocket_h = p.qr_h + p.fit_clearance
-    module_size = min(pocket_w / modules, pocket_h / modules)
-    # Build dark module squares
-    wp = cq.Workplane("XY")
+    matrix = _qr_matrix(payload, qz)
+    modules = matrix.shape[0]  # width in modules including quiet zone
+    d = derive(p)
+    module_size = min(d.pocket_w / modules, d.pocket_h / modules)
     # Origin align so that QR is centered in pocket
     total_w = modules * module_size
     total_h = modules * module_size
     x0 = -total_w / 2
     y0 = -total_h / 2
-    dark_count = 0
-    for r, row in enumerate(qr.matrix_iter(scale=1, border=qz)):
-        for c, bit in enumerate(row):
-            if bit:  # dark
-                dark_count += 1
-                cx = x0 + (c + 0.5) * module_size
-                cy = y0 + (r + 0.5) * module_size
-                wp = wp.union(
-                    cq.Workplane("XY").center(cx, cy).rect(module_size, module_size).extrude(p.island_h).translate((0, 0, p.body_t / 2))
-                )
+    # Run-length encode each row so contiguous dark modules become one box,
+    # then fuse every box in a single boolean instead of one union per module
+    rows, starts, lengths = _qr_runs(matrix)
+    dark_count = int(matrix.sum())
+    xs = x0 + starts * module_size
+    ys = y0 + rows * module_size
+    # Dark modules meeting only at a corner would share a bare edge, which no
+    # manifold mesh can hold. Fill a small square of the light module just
+    # below that corner: it shares a face with both dark ones, and face
+    # contacts (unlike overlaps) keep the fuse cheap
+    m = matrix
+    rising = m[:-1, :-1] & m[1:, 1:] & ~m[:-1, 1:] & ~m[1:, :-1]
+    falling = m[:-1, 1:] & m[1:, :-1] & ~m[:-1, :-1] & ~m[1:, 1:]
+    corner_rows, corner_cols = np.nonzero(rising | falling)
+    bx = x0 + (corner_cols + 1) * module_size - QR_BRIDGE * falling[corner_rows, corner_cols]
+    by = y0 + (corner_rows + 1) * module_size - QR_BRIDGE
+
+    def fuse_runs() -> cq.Workplane:
+        boxes = [
+            cq.Solid.makeBox(n * module_size, module_size, p.island_h, pnt=cq.Vector(x, y, p.body_t / 2))
+            for x, y, n in zip(xs.tolist(), ys.tolist(), lengths.tolist())
+        ]
+        boxes += [
+            cq.Solid.makeBox(QR_BRIDGE, QR_BRIDGE, p.island_h, pnt=cq.Vector(x, y, p.body_t / 2))
+            for x, y in zip(bx.tolist(), by.tolist())
+        ]
+        fused = boxes[0].fuse(*boxes[1:]).clean() if len(boxes) > 1 else boxes[0]
+        return cq.Workplane("XY").newObject([fused])
+
+    wp = _brep_cached("qr_islands", (key, payload_hash), fuse_runs)
     meta = {
         "mode": "qr",
         "qr_payload_hash": payload_hash,
@@ -304,73 +637,378 @@ def build_qr_islands(p: Params, qr_text: Optional[str], qr_svg: Optional[Path])
     return wp, meta
 
 
-def _triangulate_and_write(mesh: trimesh.Trimesh, path: Path, deterministic: bool) -> None:
+def _triangulate_and_write(vertices: np.ndarray, faces: np.ndarray, path: Path, deterministic: bool) -> None:
     # enforce face ordering determinism by sorting on quantized vertex coords
     if deterministic:
-        verts = mesh.vertices
-        faces = mesh.faces
-        # build sort keys per face
-        def face_key(fi: int):
-            pts = verts[faces[fi]]
-            # quantize to 1e-6 mm
-            q = (pts * 1e6).round().astype(int).tolist()
-            # sort vertices within face for stability
-            q.sort()
-            return q
-
-        order = sorted(range(len(mesh.faces)), key=face_key)
-        mesh = trimesh.Trimesh(vertices=mesh.vertices.copy(), faces=mesh.faces[order].copy(), process=False)
+        # quantize to 1e-6 mm, sort vertices within each face for stability,
+        # then order faces lexicographically on the 9 coordinates
+        q = np.round(vertices[faces] * 1e6).astype(np.int64)
+        q = q[np.arange(len(q))[:, None], np.lexsort(q.transpose(2, 0, 1)[::-1], axis=-1)]
+        keys = q.reshape(len(q), 9)
+        faces = faces[np.lexsort(keys.T[::-1])]
     # Write binary STL with fixed header
     header = b"CadQuery deterministic STL\x00".ljust(80, b"\x00")
-    data = trimesh.exchange.stl.export_stl(mesh, header=header)
-    path.write_bytes(data)
+    _atomic_write(path, _stl_bytes(vertices, faces, header))
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` beside ``path`` and rename it into place.
+
+    An interrupted run never leaves a truncated STL behind.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _stl_bytes(vertices: np.ndarray, faces: np.ndarray, header: bytes) -> bytes:
+    """Pack a binary STL in one buffer: 80-byte header, count, then records.
+
+    Normals are filled vectorized from the winding; degenerate faces get zero.
+    """
+    tris = np.asarray(vertices, dtype=np.float64)[np.asarray(faces)]
+    normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    length = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, length, out=normals, where=length > 0)
+    rec = np.zeros(len(tris), dtype=_stl_record())
+    rec["normal"] = normals
+    rec["v"] = tris
+    return header.ljust(80, b"\x00")[:80] + len(rec).to_bytes(4, "little") + rec.tobytes()
+
+
+def _write_bin(shape: cq.Shape, f) -> None:
+    """Write ``shape`` as binary BRep (format version 3, no triangulation).
+
+    ``Shape.exportBin`` writes OCCT 7.7's default version 4, which fails to
+    read back for some glyph and fused QR shapes; meshes are recomputed on
+    load anyway.
+    """
+    from OCP.BinTools import BinTools, BinTools_FormatVersion
+
+    BinTools.Write_s(shape.wrapped, f, False, False, BinTools_FormatVersion.BinTools_FormatVersion_VERSION_3)
+
 
+def _to_shape(model: cq.Workplane) -> cq.Shape:
+    shapes = [o for o in model.vals() if isinstance(o, cq.Shape)]
+    return shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
 
-def export_stl(model: cq.Workplane, path: Path, *, deterministic: bool = False) -> None:
+
+def _tessellate(model: cq.Workplane, tolerance: float = 1e-3, angular_tolerance: float = 0.1) -> trimesh.Trimesh:
+    """Tessellate ``model`` in memory with OCCT's parallel mesher.
+
+    Same deflection settings as the CadQuery STL exporter, so the triangles
+    match what would have been written to disk.
+    """
+    vertices, faces = _mesh_arrays(_to_shape(model), tolerance, angular_tolerance)
+    # process=True merges the per-face duplicate vertices so edges are shared
+    return trimesh.Trimesh(vertices=vertices, faces=faces)
+
+
+def _mesh_arrays(shape: cq.Shape, tolerance: float, angular_tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Mesh ``shape`` and read each face's Poly_Triangulation into numpy.
+
+    Same vertices and faces as ``Shape.tessellate`` without building a
+    ``Vector`` per node; face locations are applied as one matrix product.
+    """
+    from OCP.BRep import BRep_Tool
+    from OCP.BRepMesh import BRepMesh_IncrementalMesh
+    from OCP.TopAbs import TopAbs_REVERSED
+    from OCP.TopLoc import TopLoc_Location
+
+    BRepMesh_IncrementalMesh(shape.wrapped, tolerance, True, angular_tolerance, True)
+    vertices, faces, offset = [], [], 0
+    for face in shape.Faces():
+        loc = TopLoc_Location()
+        poly = BRep_Tool.Triangulation_s(face.wrapped, loc)
+        if poly is None:
+            continue
+        n = poly.NbNodes()
+        pts = np.array([poly.Node(i).Coord() for i in range(1, n + 1)], dtype=np.float64)
+        if not loc.IsIdentity():
+            t = loc.Transformation()
+            m = np.array([[t.Value(r, c) for c in range(1, 5)] for r in range(1, 4)])
+            pts = pts @ m[:, :3].T + m[:, 3]
+        tris = np.array([poly.Triangle(i).Get() for i in range(1, poly.NbTriangles() + 1)], dtype=np.int64) - 1 + offset
+        if face.wrapped.Orientation() == TopAbs_REVERSED:
+            tris = tris[:, [0, 2, 1]]
+        vertices.append(pts)
+        faces.append(tris)
+        offset += n
+    if not faces:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    return np.concatenate(vertices), np.concatenate(faces)
+
+
+def _is_watertight(faces: np.ndarray) -> bool:
+    """Cheap closed-manifold check: every edge is shared by exactly two faces.
+
+    Avoids trimesh's adjacency graph; assumes vertices are already merged.
+    """
+    if len(faces) == 0:
+        return False
+    edges = np.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    return bool(counts.min() == 2 and counts.max() == 2)
+
+
+def _weld(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Reindex ``faces`` onto unique vertices (coincident to 1e-8 mm)."""
+    q = np.round(vertices * 1e8).astype(np.int64)
+    _, inverse = np.unique(q, axis=0, return_inverse=True)
+    return inverse.reshape(-1)[faces]
+
+
+def _closed_solid(shape: cq.Shape) -> bool:
+    """Only valid solids with closed shells: BRepMesh output of each is watertight by construction.
+
+    Covers compounds too (body plus islands, a multi-solid QR layer); the
+    solids are checked one by one, since a compound's own validity says
+    nothing about its parts.
+    """
+    solids = shape.Solids()
+    return bool(solids) and all(s.isValid() and all(sh.Closed() for sh in s.Shells()) for s in solids)
+
+
+def _solids_watertight(shape: cq.Shape) -> bool:
+    """Mesh-level fallback for :func:`_closed_solid`, counting edges per solid.
+
+    Solids that touch along an edge share it in the combined mesh, where it
+    would count four faces; each body on its own must still be closed.
+    """
+    return all(_is_watertight(_weld(*_mesh_arrays(s, 1e-3, 0.1))) for s in shape.Solids() or [shape])
+
+
+def export_stl(model: cq.Workplane | trimesh.Trimesh, path: Path, *, deterministic: bool = False) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    # stable tessellation params
-    cq.exporters.export(model, str(path), tolerance=1e-3, angularTolerance=0.1)
-    mesh = trimesh.load_mesh(path)
-    if not mesh.is_watertight:
+    if isinstance(model, cq.Workplane):
+        # stable tessellation params; validated in memory, no STL round trip
+        shape = _to_shape(model)
+        vertices, faces = _mesh_arrays(shape, 1e-3, 0.1)
+        watertight = _closed_solid(shape) or _solids_watertight(shape)
+    else:
+        # already a mesh (``engine="manifold"`` booleans)
+        vertices, faces = np.asarray(model.vertices), np.asarray(model.faces)
+        watertight = _is_watertight(_weld(vertices, faces))
+    if not watertight:
         raise ValueError(f"Mesh {path} is not watertight")
-    _triangulate_and_write(mesh, path, deterministic)
+    _triangulate_and_write(vertices, faces, path, deterministic)
+
+
+def export_stls(jobs: List[Tuple[cq.Workplane, Path]], *, deterministic: bool = False) -> None:
+    """Export several independent models one after another.
+
+    BRepMesh already meshes each shape on all cores, and a worker process
+    would first have to import cadquery, which takes longer than meshing a
+    whole tag, so the models are not spread over a process pool.
+    """
+    for model, path in jobs:
+        export_stl(model, path, deterministic=deterministic)
+
+
+# Finished builds kept under ``out/.cache``; the least recently used go first
+OUTPUT_CACHE_ENTRIES = 8
+
+
+def _restore_outputs(entry: Path, out: Path) -> bool:
+    """Copy a cached build into ``out``; False when ``entry`` is missing or partial.
+
+    ``manifest.json`` is stored last, so its presence marks a complete entry.
+    """
+    if not (entry / "manifest.json").is_file():
+        return False
+    for f in entry.iterdir():
+        shutil.copyfile(f, out / f.name)
+    os.utime(entry)  # most recently used
+    return True
+
+
+def _store_outputs(out: Path, entry: Path, names: Iterable[str]) -> None:
+    """Save the files ``names`` of a finished build as ``entry``, then evict old entries."""
+    try:
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        for name in names:
+            shutil.copyfile(out / name, tmp / name)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+        entries = [e for e in entry.parent.iterdir() if e.is_dir() and not e.name.endswith(".tmp")]
+        entries.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+        for old in entries[OUTPUT_CACHE_ENTRIES:]:
+            shutil.rmtree(old, ignore_errors=True)
+    except OSError:
+        pass  # the build in ``out`` is complete either way
+
+
+def _as_mesh(model: cq.Workplane | trimesh.Trimesh) -> trimesh.Trimesh:
+    if isinstance(model, cq.Workplane):
+        # process=True welds the per-face vertices into a manifold mesh
+        return trimesh.Trimesh(*_mesh_arrays(_to_shape(model), 1e-3, 0.1))
+    return model
+
+
+def mesh_boolean(a: cq.Workplane | trimesh.Trimesh, b: cq.Workplane | trimesh.Trimesh, op: str) -> trimesh.Trimesh:
+    """``op`` ("union" or "difference") on tessellated operands via manifold3d.
+
+    Mesh CSG is much faster than OCCT's exact BRep booleans on glyph-heavy
+    text; the result is a mesh, so it can only be exported, not modelled on.
+    """
+    if manifold3d is None:
+        raise RuntimeError("engine='manifold' requires the manifold3d package")
+    return getattr(trimesh.boolean, op)([_as_mesh(a), _as_mesh(b)], engine="manifold")
 
 
 def color_switch_layer_index(island_h: float, layer_height: float) -> int:
-    layer = max(1, round(island_h / layer_height))
-    return layer
+    return int(color_switch_layer_indices(island_h, layer_height))
+
+
+def color_switch_layer_indices(island_h, layer_height) -> np.ndarray:
+    """Vectorized :func:`color_switch_layer_index` for sweeps; inputs broadcast."""
+    ratio = np.asarray(island_h, dtype=np.float64) / np.asarray(layer_height, dtype=np.float64)
+    return np.maximum(1, np.rint(ratio)).astype(np.int32)
+
+
+@functools.cache
+def _stl_record() -> np.dtype:
+    """Binary STL record: normal, three vertices, attribute byte count."""
+    return np.dtype([("normal", "<f4", (3,)), ("v", "<f4", (3, 3)), ("attr", "<u2")])
+
+
+def _stat_key(path: Path) -> Tuple[str, int, int]:
+    """Cache key for file-derived values; a rewrite changes mtime or size."""
+    st = path.stat()
+    return str(path.resolve()), st.st_mtime_ns, st.st_size
+
+
+def _load_stl_fast(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Read a binary STL straight into (vertices, faces) arrays.
+
+    Vertices are left unmerged (three per triangle). ASCII files fall back
+    to trimesh. Parsed files are cached until they change on disk; the
+    arrays are shared, so they are returned read-only.
+    """
+    return _load_stl_cached(*_stat_key(path))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_stl_cached(path: str, mtime_ns: int, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    vertices, faces = _parse_stl(Path(path))
+    vertices, faces = np.asarray(vertices, dtype=np.float64), np.asarray(faces, dtype=np.int64)
+    vertices.flags.writeable = False
+    faces.flags.writeable = False
+    return vertices, faces
+
+
+def _parse_stl(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    data = path.read_bytes()
+    record = _stl_record()
+    n = int.from_bytes(data[80:84], "little") if len(data) >= 84 else -1
+    if n < 0 or len(data) != 84 + n * record.itemsize:
+        # ASCII: call the STL reader directly on the bytes already read,
+        # skipping load_mesh's format sniffing and Trimesh construction
+        loaded = trimesh.exchange.stl.load_stl(io.BytesIO(data))
+        if "vertices" not in loaded:  # multi-solid ASCII
+            mesh = trimesh.load_mesh(path)
+            return mesh.vertices, mesh.faces
+        return np.asarray(loaded["vertices"]), np.asarray(loaded["faces"])
+    rec = np.frombuffer(data, dtype=record, count=n, offset=84)
+    return rec["v"].reshape(-1, 3).astype(np.float64), np.arange(3 * n, dtype=np.int64).reshape(-1, 3)
 
 
 def hash_mesh(path: Path) -> str:
-    mesh = trimesh.load_mesh(path)
-    data = mesh.vertices.tobytes() + mesh.faces.tobytes()
-    return hashlib.sha256(data).hexdigest()
+    return _mesh_digest(*_load_stl_fast(path))
+
+
+# Vertex quantum for content hashing (mm); far below printer resolution
+HASH_QUANTUM = 1e-4
+# Hash behind _mesh_digest, recorded in the manifest beside the digests
+MESH_DIGEST_ALGORITHM = "xxh3_128" if xxhash is not None else "sha256"
+
+
+def _mesh_digest(vertices: np.ndarray, faces: np.ndarray) -> str:
+    """Content hash of a mesh, stable under float jitter and element order.
+
+    Vertices are snapped to ``HASH_QUANTUM``, merged and ranked lexicographically;
+    faces are rewritten in those ranks, sorted within each row and then
+    across rows, so BRepMesh's vertex/face ordering doesn't leak in.
+    """
+    q = np.round(np.asarray(vertices) / HASH_QUANTUM).astype(np.int64)
+    verts, rank = np.unique(q, axis=0, return_inverse=True)
+    faces = np.sort(rank.reshape(-1)[np.asarray(faces)], axis=1)
+    faces = np.ascontiguousarray(faces[np.lexsort(faces.T[::-1])])
+    # Identity hash, not a security boundary: prefer xxh3-128 when available.
+    # Stream both buffers into the hash without concatenating copies.
+    h = xxhash.xxh3_128() if xxhash is not None else hashlib.sha256()
+    h.update(memoryview(np.ascontiguousarray(verts)).cast("B"))
+    h.update(memoryview(faces).cast("B"))
+    return h.hexdigest()
+
+
 def save_preview_svg(path: Path, model: cq.Workplane, flip: bool = False) -> Path:
+    # a mirrored projectionDir is not the same view: OCCT picks another
+    # image X axis for it and the drawing comes out upside down
     m = model.rotate((0, 0, 0), (1, 0, 0), 180) if flip else model
     cq.exporters.export(m, str(path))
     return path
 
 
 def save_preview_png(path: Path, svg_source: Path) -> Optional[Path]:
+    cairosvg = _cairosvg()
     if cairosvg is None:
         return None
     cairosvg.svg2png(url=str(svg_source), write_to=str(path))
     return path
 
 
+def render_preview_png(path: Path, model: cq.Workplane, flip: bool = False, width_px: int = 1000) -> Optional[Path]:
+    """Rasterize a top-down shaded preview straight from the tessellation.
+
+    Skips the SVG export and Cairo re-parse; triangles are painted back to
+    front and shaded by height and normal so pockets and islands stay visible.
+    """
+    if Image is None:
+        return None
+    mesh = _tessellate(model)
+    verts = mesh.vertices.copy()
+    if flip:
+        # same view as rotating 180 degrees about X
+        verts[:, 1:] *= -1
+    lo, hi = verts[:, :2].min(axis=0), verts[:, :2].max(axis=0)
+    margin = 20
+    scale = (width_px - 2 * margin) / max(hi[0] - lo[0], 1e-9)
+    height_px = int((hi[1] - lo[1]) * scale) + 2 * margin
+    xy = np.empty((len(verts), 2))
+    xy[:, 0] = margin + (verts[:, 0] - lo[0]) * scale
+    xy[:, 1] = height_px - margin - (verts[:, 1] - lo[1]) * scale  # image y grows down
+    tris = mesh.faces
+    normals = np.cross(verts[tris[:, 1]] - verts[tris[:, 0]], verts[tris[:, 2]] - verts[tris[:, 0]])
+    nz = normals[:, 2] / np.maximum(np.linalg.norm(normals, axis=1), 1e-12)
+    keep = nz > 1e-6  # faces pointing at the viewer
+    depth = verts[tris[keep]][:, :, 2].mean(axis=1)
+    order = np.argsort(depth, kind="stable")
+    # darker = closer to the viewer, dimmed further on slopes
+    zn = (depth[order] - depth.min()) / max(np.ptp(depth), 1e-9)
+    shades = ((70 + 150 * (1 - zn)) * nz[keep][order]).astype(int)
+    img = Image.new("L", (width_px, height_px), 255)
+    draw = ImageDraw.Draw(img)
+    for tri, shade in zip(xy[tris[keep][order]], shades):
+        draw.polygon([tuple(pt) for pt in tri], fill=int(shade))
+    img.save(path)
+    return path
+
+
 def export_sticker_svg(out: Path, p: Params, qr_text: Optional[str], qr_svg: Optional[Path], *, module_size_mm: Optional[float] = None, quiet_zone_mod: int = 4) -> Tuple[Path, Optional[Path]]:
     """Export a 30x50 mm sticker SVG (and optional PNG) with registration marks.
     Returns (svg_path, png_path)."""
     if segno is None:
         raise RuntimeError("Sticker export requires segno (pure-Python QR library)")
     if qr_text:
-        qr = segno.make(qr_text, error='m')
+        payload = qr_text
     else:
         # Fallback: simple QR with repo URL if none provided
         payload = (Path(qr_svg).read_text() if qr_svg else "") or "https://example.com"
-        qr = segno.make(payload, error='m')
-    size = qr.symbol_size(quiet_zone=quiet_zone_mod)
-    modules = size[0]
+    matrix = _qr_matrix(payload, quiet_zone_mod)
+    modules = matrix.shape[0]
     if module_size_mm is None:
         module_size_mm = min(p.qr_w / modules, p.qr_h / modules)
     total_w = modules * module_size_mm
@@ -391,22 +1029,51 @@ def export_sticker_svg(out: Path, p: Params, qr_text: Optional[str], qr_svg: Opt
     # Registration marks (2mm circles)
     parts.append('<circle cx="3" cy="3" r="1" fill="none" stroke="#000" stroke-width="0.2"/>')
     parts.append('<circle cx="%s" cy="%s" r="1" fill="none" stroke="#000" stroke-width="0.2"/>' % (W-3, H-3))
-    # QR modules
-    for r, row in enumerate(qr.matrix_iter(scale=1, border=quiet_zone_mod)):
-        for c, bit in enumerate(row):
-            if bit:
-                x = x0 + c * module_size_mm
-                y = y0 + r * module_size_mm
-                parts.append('<rect x="%0.4f" y="%0.4f" width="%0.4f" height="%0.4f" fill="#000"/>' % (x, y, module_size_mm, module_size_mm))
+    # QR modules: one path in module units, scaled into place
+    rows, starts, lengths = _qr_runs(matrix)
+    d = [f"M{c} {r}h{n}v1h-{n}z" for r, c, n in zip(rows.tolist(), starts.tolist(), lengths.tolist())]
+    parts.append('<path transform="translate(%0.4f %0.4f) scale(%0.4f)" fill="#000" shape-rendering="crispEdges" d="%s"/>' % (x0, y0, module_size_mm, "".join(d)))
     parts.append('</svg>')
     svg_path.write_text("\n".join(parts))
     png_path: Optional[Path] = None
-    if cairosvg is not None:
-        png_path = out / "qr_sticker_30x50.png"
-        cairosvg.svg2png(url=str(svg_path), write_to=str(png_path))
+    if Image is not None:
+        png_path = _render_sticker_png(out / "qr_sticker_30x50.png", matrix, W, H, x0, y0, module_size_mm)
     return svg_path, png_path
 
 
+def _render_sticker_png(path: Path, matrix: np.ndarray, W: float, H: float, x0: float, y0: float, module_size_mm: float, px_per_module: int = 8) -> Path:
+    """Rasterize the sticker at a whole number of pixels per module.
+
+    The QR is upscaled with ``np.kron`` so every module stays a crisp
+    ``px_per_module`` square; the margin and registration marks are drawn on
+    top to match the SVG. No Cairo needed.
+    """
+    ppmm = px_per_module / module_size_mm
+    stroke = max(1, round(0.2 * ppmm))
+    canvas = np.full((round(H * ppmm), round(W * ppmm)), 255, dtype=np.uint8)
+    qr = np.kron(np.where(matrix, 0, 255).astype(np.uint8), np.ones((px_per_module, px_per_module), dtype=np.uint8))
+    # A pocket-sized module can make the QR overhang the canvas; clip both sides
+    top, left = round(y0 * ppmm), round(x0 * ppmm)
+    y, x = max(top, 0), max(left, 0)
+    canvas[y:top + qr.shape[0], x:left + qr.shape[1]] = qr[y - top:canvas.shape[0] - top, x - left:canvas.shape[1] - left]
+    img = Image.fromarray(canvas)  # uint8 2-D -> "L"
+    draw = ImageDraw.Draw(img)
+    # Safe margin: 2 mm dashes, 1 mm inset
+    x1, y1, x2, y2 = (round(v * ppmm) for v in (1, 1, W - 1, H - 1))
+    dash = round(2 * ppmm)
+    for x in range(x1, x2, 2 * dash):
+        draw.line([(x, y1), (min(x + dash, x2), y1)], fill=0, width=stroke)
+        draw.line([(x, y2), (min(x + dash, x2), y2)], fill=0, width=stroke)
+    for y in range(y1, y2, 2 * dash):
+        draw.line([(x1, y), (x1, min(y + dash, y2))], fill=0, width=stroke)
+        draw.line([(x2, y), (x2, min(y + dash, y2))], fill=0, width=stroke)
+    # Registration marks
+    for cx, cy in ((3, 3), (W - 3, H - 3)):
+        draw.ellipse([(cx - 1) * ppmm, (cy - 1) * ppmm, (cx + 1) * ppmm, (cy + 1) * ppmm], outline=0, width=stroke)
+    img.save(path, compress_level=1)
+    return path
+
+
 def _validate_inputs(p: Params) -> None:
     if p.qr_w <= 0 or p.qr_h <= 0:
         raise ValueError("qr_w and qr_h must be positive")
@@ -421,34 +1088,42 @@ def _validate_inputs(p: Params) -> None:
 
 
 def _two_tone_asserts(p: Params, base_path: Path, feat_path: Path) -> None:
-    b = trimesh.load_mesh(base_path)
-    f = trimesh.load_mesh(feat_path)
-    # XY AABB equal
-    assert abs((b.bounds[0][0] - f.bounds[0][0])) < 1e-3 and abs((b.bounds[1][0] - f.bounds[1][0])) < 1e-3
-    assert abs((b.bounds[0][1] - f.bounds[0][1])) < 1e-3 and abs((b.bounds[1][1] - f.bounds[1][1])) < 1e-3
-    # Z contact
-    assert abs(b.bounds[1][2] - p.body_t / 2) < 1e-3
-    assert abs(f.bounds[0][2] - p.body_t / 2) < 1e-3
-    # No overlap
-    assert b.bounds[1][2] <= f.bounds[0][2] + 1e-6
+    # bounds only need the vertices, shared with hash_mesh via the parse cache
+    bv, _ = _load_stl_fast(base_path)
+    fv, _ = _load_stl_fast(feat_path)
+    b = np.stack([bv.min(axis=0), bv.max(axis=0)])
+    f = np.stack([fv.min(axis=0), fv.max(axis=0)])
+    # XY: features inside the base footprint (a ring island spans all of it)
+    assert (f[0, :2] >= b[0, :2] - 1e-3).all() and (f[1, :2] <= b[1, :2] + 1e-3).all()
+    # Z contact, no overlap
+    assert abs(b[1, 2] - p.body_t / 2) < 1e-3 and abs(f[0, 2] - p.body_t / 2) < 1e-3
+    assert b[1, 2] <= f[0, 2] + 1e-6
 
 
 def _geom_integrity_checks(p: Params, model: cq.Workplane, strict: bool = False) -> None:
     # Strap reinforcement thickness heuristic: check that local pad adds at least ~0.5 mm above body_t.
     # We do a coarse check using bounding box deltas across strap y region.
     try:
-        mesh = trimesh.load_mesh(trimesh.exchange.stl.export_stl(cq.exporters.toString(model, 'STL')))
+        mesh = _tessellate(model)
     except Exception:
         return
     ok = True
-    if not mesh.is_watertight:
+    if not _is_watertight(mesh.faces):
         ok = False
     if not ok and strict:
         raise ValueError("Geometry integrity failed: mesh not watertight")
 
 
 def _sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    # manifest and checksums file both ask for the same digests
+    return _sha256_cached(*_stat_key(path))
+
+
+@functools.lru_cache(maxsize=128)
+def _sha256_cached(path: str, mtime_ns: int, size: int) -> str:
+    # streamed in chunks so large STLs are never held in memory whole
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def build_and_export(
@@ -465,49 +1140,87 @@ def build_and_export(
     qr_text: Optional[str] = None,
     qr_svg: Optional[Path] = None,
     text_features: bool = False,
+    engine: str = "occ",
 ) -> Path:
     _validate_inputs(p)
+    if engine not in ("occ", "manifold"):
+        raise ValueError(f"Unknown boolean engine: {engine}")
     if deterministic:
         os.environ["PYTHONHASHSEED"] = "0"
         random.seed(0)
+    out.mkdir(parents=True, exist_ok=True)
+    qr_svg_hash = _sha256(Path(qr_svg)) if qr_svg else None
+    key = params_hash(p, qr_text=qr_text, qr_svg=qr_svg_hash, deterministic=deterministic, engine=engine)
+
+    def _file_sha256(path: Path | None):
+        if path and path.exists():
+            return _sha256(path)
+        return None
+    fonts = [_file_sha256(Path(f) if f else None) for f in (p.front_font_path, p.back_font_path)]
+    # Every input that shapes the output set, so a hit can skip all geometry work
+    cache_key = params_hash(
+        p, qr_text=qr_text, qr_svg=qr_svg_hash, deterministic=deterministic, engine=engine,
+        variant=variant, previews=previews, layer_height=layer_height, strict=strict,
+        coupons=sorted({t.strip().lower() for t in emit_coupons or ()}), preset=preset,
+        text_features=text_features, fonts=fonts, toolchain=_toolchain(),
+    )
+    cache_entry = out / ".cache" / cache_key
+    if _restore_outputs(cache_entry, out):
+        return out
+    d = derive(p)
     body, width, height = build_body(p)
     base = body
     islands, qrmeta = build_qr_islands(p, qr_text, qr_svg)
-    out.mkdir(parents=True, exist_ok=True)
-    manifest = {"parameters": asdict(p), "files": {}, "deterministic": deterministic}
+    manifest = {"parameters": asdict(p), "params_hash": key, "files": {}, "deterministic": deterministic}
     if preset:
         manifest["preset"] = preset
+    if engine != "occ":
+        manifest["engine"] = engine
     if qrmeta:
         manifest.update(qrmeta)
     if layer_height:
         manifest["color_switch_layer"] = color_switch_layer_index(p.island_h, layer_height)
+    # Sticker SVG/PNG only depend on the QR; rasterize it on a side thread
+    # (PNG compression drops the GIL) while the STLs are built and exported
+    _resolve_lazy(np, segno, Image, ImageDraw)
+    sticker_pool = ThreadPoolExecutor(max_workers=1)
+    sticker = sticker_pool.submit(export_sticker_svg, out, p, qr_text, qr_svg, module_size_mm=qrmeta.get('module_size_mm'))
+    sticker_pool.shutdown(wait=False)
 
     # Export variants
     # Front/back text solids
     front_text = _text_solid_front(p, width, height)
     back_text = _text_solids_back(p, width, height)
-    # Apply text to base
-    base_with_text = base
-    if p.front_text_style == "emboss" and not front_text.val().isNull():
-        base_with_text = base_with_text.union(front_text)
-    if p.front_text_style == "engrave" and not front_text.val().isNull():
-        base_with_text = base_with_text.cut(front_text)
-    if p.back_text_style == "emboss" and not back_text.val().isNull():
-        base_with_text = base_with_text.union(back_text)
-    if p.back_text_style == "engrave" and not back_text.val().isNull():
+    # Apply text to base (OCCT BRep booleans, or mesh booleans via manifold3d)
+    def combine(a, b, op: str):
+        if engine == "manifold":
+            return mesh_boolean(a, b, op)
+        return a.union(b) if op == "union" else a.cut(b)
+
+    # Text below the colour-switch plane goes into base_below; a front emboss
+    # rises past it, so the islands variant prints that with the features
+    base_below = base
+    if p.front_text_style == "engrave" and front_text is not None:
+        base_below = combine(base_below, front_text, "difference")
+    if p.back_text_style == "emboss" and back_text is not None:
+        base_below = combine(base_below, back_text, "union")
+    if p.back_text_style == "engrave" and back_text is not None:
         # Ensure min wall
         if p.body_t - p.back_text_depth < p.min_wall:
             raise ValueError("Back engraving violates minimum wall thickness")
-        base_with_text = base_with_text.cut(back_text)
-
+        base_below = combine(base_below, back_text, "difference")
+    front_emboss = front_text if p.front_text_style == "emboss" else None
+    base_with_text = base_below
+    if front_emboss is not None:
+        base_with_text = combine(base_below, front_emboss, "union")
+
+    # Keep-out regions: QR pocket rect (front) and NFC circle (back)
+    qr_rect = (-d.pocket_w/2, -d.pocket_h/2, d.pocket_w/2, d.pocket_h/2)
+    nfc_r = (p.nfc_d + p.fit_clearance) / 2.0
     # Keep-out validation (strict): check XY bounding boxes of text against QR pocket, NFC, strap
     if strict:
-        # QR pocket rect (front)
-        pocket_w = p.qr_w + p.fit_clearance
-        pocket_h = p.qr_h + p.fit_clearance
-        qr_rect = (-pocket_w/2, -pocket_h/2, pocket_w/2, pocket_h/2)
-        def wp_bbox_xy(wp: cq.Workplane):
-            if wp.val().isNull():
+        def wp_bbox_xy(wp: Optional[cq.Workplane]):
+            if wp is None:
                 return None
             bb = wp.val().BoundingBox()
             return (bb.xmin, bb.ymin, bb.xmax, bb.ymax)
@@ -517,7 +1230,6 @@ def build_and_export(
         if front_bb and rects_overlap(front_bb, qr_rect):
             raise ValueError("Front prompt intersects QR pocket keep-out")
         # Back keep-outs: NFC circle and strap
-        nfc_r = (p.nfc_d + p.fit_clearance) / 2.0
         def rect_circle_intersect(rect, cx, cy, r):
             # clamp point
             x = min(max(cx, rect[0]), rect[2])
@@ -528,7 +1240,7 @@ def build_and_export(
         if back_bb and rect_circle_intersect(back_bb, 0.0, 0.0, nfc_r):
             raise ValueError("Back text intersects NFC keep-out")
         # Strap keep-out projection
-        strap_center_y = (p.qr_h + 2 * p.qr_border) / 2 - p.min_wall - ((p.strap_slot_l or p.strap_hole_d) / 2)
+        strap_center_y = d.strap_center_y
         if p.strap_slot_w and p.strap_slot_l:
             strap_rect = (-p.strap_slot_l/2, strap_center_y - p.strap_slot_w/2, p.strap_slot_l/2, strap_center_y + p.strap_slot_w/2)
             if front_bb and rects_overlap(front_bb, strap_rect):
@@ -543,102 +1255,98 @@ def build_and_export(
             if back_bb and rect_circle_intersect(back_bb, 0.0, strap_center_y, sr):
                 raise ValueError("Back text intersects strap hole keep-out")
 
+    # Collect every STL (variants, text features, coupons) first so they can
+    # be tessellated side by side
+    stl_jobs: List[Tuple[cq.Workplane, Path]] = []
     if variant in ("base", "all"):
-        path = out / "tag_base.stl"
-        export_stl(base_with_text.union(islands), path, deterministic=deterministic)
+        # The union is the most expensive OCCT op here; compute it once and
+        # share it between the STL export and both previews, and skip it when
+        # text makes the STL a different union and no preview is requested.
+        combined = None
+        if base_with_text is base or previews in ("svg", "png"):
+            combined = build_all(p) if qrmeta.get("mode") == "ring" else fast_union(base, islands)
+        if base_with_text is base:
+            tagged = combined
+        elif isinstance(base_with_text, cq.Workplane):
+            tagged = fast_union(base_with_text, islands)
+        else:
+            tagged = mesh_boolean(base_with_text, islands, "union")
+        stl_jobs.append((tagged, out / "tag_base.stl"))
+    if variant in ("flat", "all"):
+        stl_jobs.append((base, out / "tag_alt_flat_front.stl"))
+    if variant in ("islands", "all"):
+        path_b = out / "tag_alt_qr_islands_base.stl"
+        path_f = out / "tag_alt_qr_islands_features.stl"
+        stl_jobs.append((base_below, path_b))
+        stl_jobs.append((islands if front_emboss is None else fast_union(islands, front_emboss), path_f))
+    # Optional text features for two-tone printing
+    if text_features:
+        if front_text is not None:
+            stl_jobs.append((front_text, out / "front_text_features.stl"))
+        if back_text is not None and p.back_text_style == "emboss":
+            stl_jobs.append((back_text, out / "back_text_features.stl"))
+    # Optional coupons
+    for token in emit_coupons or ():
+        token = token.strip().lower()
+        if token == "nfc":
+            coupon = (
+                cq.Workplane("XY")
+                .circle((p.nfc_d + p.fit_clearance) / 2)
+                .extrude(p.nfc_depth)
+            )
+            stl_jobs.append((coupon, out / "coupon_nfc.stl"))
+        if token == "strap":
+            if p.strap_slot_w and p.strap_slot_l:
+                coupon = cq.Workplane("XY").slot2D(p.strap_slot_l, p.strap_slot_w).extrude(p.body_t)
+                name = "coupon_strap_slot.stl"
+            else:
+                coupon = cq.Workplane("XY").circle(p.strap_hole_d / 2).extrude(p.body_t)
+                name = "coupon_strap_hole.stl"
+            stl_jobs.append((coupon, out / name))
+    export_stls(stl_jobs, deterministic=deterministic)
+    for _, path in stl_jobs:
         manifest["files"][str(path.name)] = {"sha256": _sha256(path)}
-        # Previews
+    if variant in ("islands", "all"):
+        _two_tone_asserts(p, path_b, path_f)
+
+    # Previews
+    if variant in ("base", "all"):
         if previews in ("svg", "png"):
             svg = out / "preview_front.svg"
-            save_preview_svg(svg, base.union(islands))
+            save_preview_svg(svg, combined)
             manifest["files"][svg.name] = {"sha256": _sha256(svg)}
             if previews == "png":
                 png = out / "preview_front.png"
-                if save_preview_png(png, svg):
+                if render_preview_png(png, combined):
                     manifest["files"][png.name] = {"sha256": _sha256(png)}
                 else:
                     print("[warn] PNG preview unavailable; falling back to SVG")
         if previews in ("svg", "png"):
             svg = out / "preview_back.svg"
-            save_preview_svg(svg, base.union(islands).rotate((0, 0, 0), (1, 0, 0), 180))
+            save_preview_svg(svg, combined, flip=True)
             manifest["files"][svg.name] = {"sha256": _sha256(svg)}
             if previews == "png":
                 png = out / "preview_back.png"
-                if save_preview_png(png, svg):
+                if render_preview_png(png, combined, flip=True):
                     manifest["files"][png.name] = {"sha256": _sha256(png)}
                 else:
                     print("[warn] PNG preview unavailable; falling back to SVG")
 
-    if variant in ("flat", "all"):
-        path = out / "tag_alt_flat_front.stl"
-        export_stl(base, path, deterministic=deterministic)
-        manifest["files"][str(path.name)] = {"sha256": _sha256(path)}
-
-    if variant in ("islands", "all"):
-        path_b = out / "tag_alt_qr_islands_base.stl"
-        path_f = out / "tag_alt_qr_islands_features.stl"
-        export_stl(base_with_text, path_b, deterministic=deterministic)
-        export_stl(islands, path_f, deterministic=deterministic)
-        manifest["files"][str(path_b.name)] = {"sha256": _sha256(path_b)}
-        manifest["files"][str(path_f.name)] = {"sha256": _sha256(path_f)}
-        _two_tone_asserts(p, path_b, path_f)
-
-    # Optional text features for two-tone printing
-    if text_features:
-        if not front_text.val().isNull():
-            pth = out / "front_text_features.stl"
-            export_stl(front_text, pth, deterministic=deterministic)
-            manifest["files"][pth.name] = {"sha256": _sha256(pth)}
-        if not back_text.val().isNull() and p.back_text_style == "emboss":
-            pth = out / "back_text_features.stl"
-            export_stl(back_text, pth, deterministic=deterministic)
-            manifest["files"][pth.name] = {"sha256": _sha256(pth)}
-
-    # Optional coupons
-    if emit_coupons:
-        for token in emit_coupons:
-            token = token.strip().lower()
-            if token == "nfc":
-                coupon = (
-                    cq.Workplane("XY")
-                    .circle((p.nfc_d + p.fit_clearance) / 2)
-                    .extrude(p.nfc_depth)
-                )
-                path = out / "coupon_nfc.stl"
-                export_stl(coupon, path, deterministic=deterministic)
-                manifest["files"][path.name] = {"sha256": _sha256(path)}
-            if token == "strap":
-                if p.strap_slot_w and p.strap_slot_l:
-                    coupon = cq.Workplane("XY").slot2D(p.strap_slot_l, p.strap_slot_w).extrude(p.body_t)
-                    name = "coupon_strap_slot.stl"
-                else:
-                    coupon = cq.Workplane("XY").circle(p.strap_hole_d / 2).extrude(p.body_t)
-                    name = "coupon_strap_hole.stl"
-                path = out / name
-                export_stl(coupon, path, deterministic=deterministic)
-                manifest["files"][path.name] = {"sha256": _sha256(path)}
-
     # Font hashes and text hashes
-    def _file_sha256(path: Path | None):
-        if path and path.exists():
-            return hashlib.sha256(path.read_bytes()).hexdigest()
-        return None
-    manifest["front_font_sha256"] = _file_sha256(Path(p.front_font_path) if p.front_font_path else None)
-    manifest["back_font_sha256"] = _file_sha256(Path(p.back_font_path) if p.back_font_path else None)
-    # Text solids hashes via temporary STL bytes
-    def workplane_hash(wp: cq.Workplane) -> Optional[str]:
-        try:
-            if wp.val().isNull():
-                return None
-        except Exception:
+    manifest["front_font_sha256"], manifest["back_font_sha256"] = fonts
+    # Text solids hashes via the in-memory tessellation (no STL string export)
+    def workplane_hash(wp: Optional[cq.Workplane]) -> Optional[str]:
+        if wp is None:
             return None
-        s = cq.exporters.toString(wp, 'STL')
-        if not s:
+        mesh = _tessellate(wp)
+        if mesh.is_empty:
             return None
-        b = s.encode('utf-8', errors='ignore')
-        return hashlib.sha256(b).hexdigest()
-    manifest["front_text_hash"] = workplane_hash(front_text)
-    manifest["back_text_hash"] = workplane_hash(back_text)
+        return _mesh_digest(mesh.vertices, mesh.faces)
+    # Mesh content digests, not file SHA-256s: named apart from the old
+    # ``*_text_hash`` keys so nothing compares them against STL checksums
+    manifest["front_text_mesh_digest"] = workplane_hash(front_text)
+    manifest["back_text_mesh_digest"] = workplane_hash(back_text)
+    manifest["mesh_digest"] = {"algorithm": MESH_DIGEST_ALGORITHM, "quantum_mm": HASH_QUANTUM}
     manifest["front_prompt_edge"] = p.front_prompt_edge
     manifest["front_prompt_h"] = p.front_prompt_h
     manifest["back_text_h"] = p.back_text_h
@@ -649,24 +1357,20 @@ def build_and_export(
         "qr_pocket_rect": [qr_rect[0], qr_rect[1], qr_rect[2], qr_rect[3]],
         "nfc_circle": {"cx": 0.0, "cy": 0.0, "r": nfc_r},
     }
-    # Write manifest and checksums
-    (out / "manifest.json").write_text(json.dumps(manifest, indent=2))
-    with (out / "checksums.sha256").open('w') as f:
-        for name, info in sorted(manifest["files"].items()):
-            f.write(f"{info['sha256']}  {name}\n")
     # Sticker templates
     try:
-        ssvg, spng = export_sticker_svg(out, p, qr_text, qr_svg, module_size_mm=qrmeta.get('module_size_mm') if 'qrmeta' in locals() else None)
+        ssvg, spng = sticker.result()
         manifest["files"][ssvg.name] = {"sha256": _sha256(ssvg)}
         if spng:
             manifest["files"][spng.name] = {"sha256": _sha256(spng)}
-        (out / "manifest.json").write_text(json.dumps(manifest, indent=2))
-        with (out / "checksums.sha256").open('a') as f:
-            f.write(f"{_sha256(ssvg)}  {ssvg.name}\n")
-            if spng:
-                f.write(f"{_sha256(spng)}  {spng.name}\n")
     except Exception as e:
         print(f"[warn] Sticker export failed: {e}")
+    # Write manifest and checksums once every artifact is in
+    (out / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    (out / "checksums.sha256").write_text(
+        "".join(f"{info['sha256']}  {name}\n" for name, info in sorted(manifest["files"].items()))
+    )
+    _store_outputs(out, cache_entry, [*manifest["files"], "checksums.sha256", "manifest.json"])
     return out
 
 
@@ -719,14 +1423,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--back_font_path", type=str)
     parser.add_argument("--back_text_depth", type=float)
     parser.add_argument("--text_features", action="store_true")
+    parser.add_argument("--engine", choices=["occ", "manifold"], default="occ", help="Boolean engine for applying text (manifold needs manifold3d)")
     return parser.parse_args()
 
 
 def apply_overrides(p: Params, args: argparse.Namespace) -> None:
-    for field in asdict(p).keys():
-        val = getattr(args, field, None)
+    # fields() lists names without asdict's deep copy of every value
+    given = vars(args)
+    for f in fields(Params):
+        val = given.get(f.name)
         if val is not None:
-            setattr(p, field, val)
+            setattr(p, f.name, val)
     # CLI contracts: explicit --hole or --slot
     if getattr(args, "hole", None) is not None:
         p.strap_hole_d = float(args.hole)
@@ -766,6 +1473,7 @@ def main():
         qr_text=getattr(args, 'qr_text', None),
         qr_svg=getattr(args, 'qr_svg', None),
         text_features=getattr(args, 'text_features', False),
+        engine=args.engine,
     )
 
 
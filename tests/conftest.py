@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_shape_cache(tmp_path_factory, monkeypatch):
+    # keep the BRep and QR matrix caches out of ~/.cache, one cold cache per test
+    monkeypatch.setenv('LUGGAGE_TAG_CACHE', str(tmp_path_factory.mktemp('luggage_tag_cache')))
@@ -51,3 +51,25 @@ def test_previews(tmp_path):
         inter = np.logical_and(img1, img2).sum()
         union = np.logical_or(img1, img2).sum()
         assert inter / union >= 0.98
+
+
+def test_render_preview_png_size(tmp_path):
+    p = gt.Params()
+    model = gt.build_all(p)
+    width = p.qr_w + 2 * p.qr_border
+    height = p.qr_h + 2 * p.qr_border
+    for flip in (False, True):
+        png = gt.render_preview_png(tmp_path / f'preview_{flip}.png', model, flip=flip, width_px=1000)
+        img = np.array(Image.open(png))
+        # 20 px margin on each side, the tag scaled to the remaining width
+        assert img.shape == (int(height * 960 / width) + 40, 1000)
+        assert (img < 255).mean() > 0.5  # most of the frame is the shaded tag
+
+
+def test_back_preview_svg_matches_rotated_model(tmp_path):
+    # asymmetric about every axis, so a mirrored or upside-down view shows
+    model = gt.cq.Workplane('XY').box(30, 10, 4).union(gt.cq.Workplane('XY').box(6, 6, 8).translate((10, 6, 3)))
+    ref = tmp_path / 'ref.svg'
+    gt.cq.exporters.export(model.rotate((0, 0, 0), (1, 0, 0), 180), str(ref))
+    gt.save_preview_svg(tmp_path / 'back.svg', model, flip=True)
+    assert (tmp_path / 'back.svg').read_text() == ref.read_text()
@@ -23,3 +23,50 @@ def test_default_bbox_and_watertight(tmp_path):
     assert abs(bbox[0] - width) < 0.1
     assert abs(bbox[1] - height) < 0.1
     assert thickness_min - 0.1 <= bbox[2] <= thickness_max
+
+
+def test_watertight_check_counts_edges_per_solid():
+    cq = gt.cq
+    # two closed boxes touching along one vertical edge
+    a = cq.Solid.makeBox(1, 1, 1)
+    b = cq.Solid.makeBox(1, 1, 1, pnt=cq.Vector(1, 1, 0))
+    pair = cq.Compound.makeCompound([a, b])
+    assert gt._closed_solid(pair)
+    assert gt._solids_watertight(pair)
+    # the combined mesh puts that edge on four faces
+    assert not gt._is_watertight(gt._weld(*gt._mesh_arrays(pair, 1e-3, 0.1)))
+    face = cq.Face.makePlane(1, 1)
+    assert not gt._closed_solid(face)
+    assert not gt._solids_watertight(face)
+
+
+def test_fast_union_only_skips_disjoint_solids():
+    cq = gt.cq
+    a = cq.Workplane(obj=cq.Solid.makeBox(1, 1, 1))
+    touching = cq.Workplane(obj=cq.Solid.makeBox(1, 1, 1, pnt=cq.Vector(0, 0, 1)))
+    apart = cq.Workplane(obj=cq.Solid.makeBox(1, 1, 1, pnt=cq.Vector(0, 0, 1.001)))
+    assert len(gt._to_shape(gt.fast_union(a, touching)).Solids()) == 1
+    assert len(gt._to_shape(gt.fast_union(a, apart)).Solids()) == 2
+
+
+def test_brep_cache_hit_miss_and_disable(tmp_path, monkeypatch):
+    monkeypatch.setenv('LUGGAGE_TAG_CACHE', str(tmp_path))
+    # glyphs are the shapes OCCT's default binary BRep version can't read back
+    text = gt._text_solid_front(gt.Params(), 56, 36)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return text
+
+    gt._brep_cached('test', ('a',), build)
+    hit = gt._brep_cached('test', ('a',), build)
+    assert len(calls) == 1
+    assert hit.val() is not text.val()
+    assert abs(hit.val().Volume() - text.val().Volume()) < 1e-9
+    gt._brep_cached('test', ('b',), build)
+    assert len(calls) == 2
+    assert len(list(tmp_path.glob('*.bin'))) == 2
+    monkeypatch.setenv('LUGGAGE_TAG_CACHE', '')
+    gt._brep_cached('test', ('a',), build)
+    assert len(calls) == 3
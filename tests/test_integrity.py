@@ -91,6 +91,16 @@ def test_color_switch_layer_index():
             assert abs(layer * lh - ih) <= 0.02
 
 
+def test_color_switch_layer_indices_matches_scalar():
+    ihs = np.array([0.3, 0.4, 0.5, 0.6, 1.0])
+    lhs = np.array([0.08, 0.12, 0.16, 0.20, 0.28])
+    grid = gt.color_switch_layer_indices(ihs[:, None], lhs[None, :])
+    assert grid.shape == (5, 5)
+    for i, ih in enumerate(ihs):
+        for j, lh in enumerate(lhs):
+            assert grid[i, j] == gt.color_switch_layer_index(ih, lh) == max(1, round(ih / lh))
+
+
 def test_cli_determinism(tmp_path):
     p = gt.Params()
     out1 = tmp_path / "a"
@@ -102,6 +112,55 @@ def test_cli_determinism(tmp_path):
     assert h1 == h2
 
 
+def test_mesh_digest_ignores_element_order():
+    mesh = gt._tessellate(gt.build_islands(gt.Params()))
+    vertices, faces = np.asarray(mesh.vertices), np.asarray(mesh.faces)
+    digest = gt._mesh_digest(vertices, faces)
+    rng = np.random.default_rng(0)
+    perm = rng.permutation(len(vertices))
+    moved = np.empty_like(perm)
+    moved[perm] = np.arange(len(perm))
+    shuffled = moved[faces][rng.permutation(len(faces))]
+    assert gt._mesh_digest(vertices[perm], shuffled) == digest
+    # rotating each face's vertex order keeps the winding and the digest
+    assert gt._mesh_digest(vertices, np.roll(faces, 1, axis=1)) == digest
+    assert gt._mesh_digest(vertices + [0, 0, 0.01], faces) != digest
+
+
+def test_binary_stl_round_trip(tmp_path):
+    mesh = gt._tessellate(gt.build_islands(gt.Params()))
+    vertices, faces = np.asarray(mesh.vertices), np.asarray(mesh.faces)
+    data = gt._stl_bytes(vertices, faces, b"header")
+    assert len(data) == 84 + 50 * len(faces)
+    assert data[:80] == b"header".ljust(80, b"\0")
+    path = tmp_path / "ring.stl"
+    path.write_bytes(data)
+    read_vertices, read_faces = gt._load_stl_fast(path)
+    assert np.allclose(read_vertices[read_faces], vertices[faces], atol=1e-5)  # float32 storage
+    stored = np.frombuffer(data, dtype=gt._stl_record(), offset=84)["normal"]
+    assert np.allclose(np.linalg.norm(stored, axis=1), 1.0, atol=1e-6)
+    assert trimesh.load_mesh(path).is_watertight
+
+
+def test_output_cache_hit_and_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(gt, "OUTPUT_CACHE_ENTRIES", 1)
+    p = gt.Params()
+    args = dict(previews="none", deterministic=True)
+    gt.build_and_export(p, tmp_path, "flat", **args)
+    gt.build_and_export(p, tmp_path, "flat", layer_height=0.2, **args)
+    assert len(list((tmp_path / ".cache").iterdir())) == 1  # oldest entry evicted
+    stl = (tmp_path / "tag_alt_flat_front.stl").read_bytes()
+    (tmp_path / "tag_alt_flat_front.stl").unlink()
+
+    def rebuild(*args, **kwargs):
+        raise AssertionError("geometry rebuilt")
+    monkeypatch.setattr(gt, "build_body", rebuild)
+    gt.build_and_export(p, tmp_path, "flat", layer_height=0.2, **args)
+    assert (tmp_path / "tag_alt_flat_front.stl").read_bytes() == stl
+    with pytest.raises(AssertionError, match="geometry rebuilt"):
+        gt.build_and_export(p, tmp_path, "flat", **args)
+
+
 def test_performance(tmp_path):
     proc = psutil.Process()
     p = gt.Params()
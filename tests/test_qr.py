@@ -1,6 +1,9 @@
 from pathlib import Path
+from PIL import Image
 import json
 import sys
+import numpy as np
+import trimesh
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / '3d-models'))
 import generate_tag as gt
@@ -29,6 +32,31 @@ def test_qr_islands_dark_count(tmp_path):
     assert (out / 'tag_alt_qr_islands_features.stl').exists()
 
 
+def test_qr_islands_export_watertight(tmp_path):
+    p = gt.Params()
+    islands, meta = gt.build_qr_islands(p, 'HELLO-WORLD-1234', None)
+    gt.export_stl(islands, tmp_path / 'qr.stl', deterministic=True)
+    mesh = trimesh.load_mesh(tmp_path / 'qr.stl')
+    assert mesh.is_watertight and mesh.is_winding_consistent
+    # corner bridges add next to nothing to the dark modules
+    module = meta['module_size_mm']
+    assert abs(mesh.volume - meta['dark_modules'] * module ** 2 * p.island_h) < 0.01 * mesh.volume
+
+
+def test_qr_runs_cover_dark_modules():
+    matrix = gt._qr_matrix('HELLO-WORLD-1234', 4)
+    rows, starts, lengths = gt._qr_runs(matrix)
+    rebuilt = np.zeros_like(matrix)
+    for r, c, n in zip(rows, starts, lengths):
+        assert not rebuilt[r, c:c + n].any()  # runs never overlap
+        rebuilt[r, c:c + n] = True
+    assert (rebuilt == matrix).all()
+    # maximal runs: no two of them touch within a row
+    ends = starts + lengths
+    same_row = rows[1:] == rows[:-1]
+    assert (starts[1:][same_row] > ends[:-1][same_row]).all()
+
+
 def test_sticker_svg_dimensions(tmp_path):
     p = gt.Params()
     out = gt.build_and_export(p, tmp_path, variant='islands', previews='none', deterministic=True, qr_text='DEMO')
@@ -37,6 +65,14 @@ def test_sticker_svg_dimensions(tmp_path):
     assert '<circle' in svg and '<rect' in svg
 
 
+def test_sticker_thread_alongside_export(tmp_path):
+    # the STLs export while the sticker is still rendering
+    out = gt.build_and_export(gt.Params(), tmp_path, variant='islands', previews='none', deterministic=True, qr_text='DEMO')
+    files = json.loads((out / 'manifest.json').read_text())['files']
+    for name in ['qr_sticker_30x50.svg', 'qr_sticker_30x50.png', 'tag_alt_qr_islands_base.stl', 'tag_alt_qr_islands_features.stl']:
+        assert name in files
+
+
 def test_presets_basic(tmp_path):
     for preset in ['pla', 'petg', 'abs']:
         p = gt.Params()
@@ -69,3 +105,20 @@ def test_strict_invalid_pockets(tmp_path):
     except ValueError:
         pass
 
+
+def test_sticker_png_matches_matrix(tmp_path):
+    p = gt.Params()
+    matrix = gt._qr_matrix('DEMO', 4)
+    n = matrix.shape[0]
+    # QR mode passes the pocket-sized module, so the QR overhangs the 50x30 canvas
+    module = min((p.qr_w + p.fit_clearance) / n, (p.qr_h + p.fit_clearance) / n)
+    _, png = gt.export_sticker_svg(tmp_path, p, 'DEMO', None, module_size_mm=module)
+    img = np.asarray(Image.open(png))
+    ppmm = 8 / module
+    assert img.shape == (round(p.qr_h * ppmm), round(p.qr_w * ppmm))
+    # centre pixel of every module inside the quiet zone matches the matrix
+    top = round((p.qr_h - n * module) / 2 * ppmm)
+    left = round((p.qr_w - n * module) / 2 * ppmm)
+    idx = np.arange(4, n - 4)
+    centres = img[np.ix_(top + 8 * idx + 4, left + 8 * idx + 4)]
+    assert np.array_equal(centres == 0, matrix[4:-4, 4:-4])
@@ -1,6 +1,7 @@
 from pathlib import Path
 import json
 import numpy as np
+import pytest
 import trimesh
 import sys
 
@@ -52,3 +53,16 @@ def test_min_wall_for_back_engrave():
     except ValueError:
         pass
 
+
+def test_manifold_engine_matches_occ(tmp_path):
+    pytest.importorskip('manifold3d')
+    p = gt.Params(back_name='REDACTED', back_phone='REDACTED', back_text_style='engrave')
+    meshes = {}
+    for engine in ('occ', 'manifold'):
+        out = gt.build_and_export(p, tmp_path / engine, variant='base', previews='none', deterministic=True, engine=engine)
+        meshes[engine] = trimesh.load_mesh(out / 'tag_base.stl')
+    assert meshes['manifold'].is_watertight
+    # the embossed default prompt overlaps the ring, so both must be fused
+    assert len(meshes['manifold'].split(only_watertight=False)) == 1
+    assert np.allclose(meshes['manifold'].bounds, meshes['occ'].bounds, atol=1e-3)
+    assert abs(meshes['manifold'].volume - meshes['occ'].volume) < 1e-5 * meshes['occ'].volume